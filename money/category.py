@@ -11,6 +11,8 @@ and categorization instructions, and they return new series.
 
 - :func:`money.category.categorize` applies a category to each item.
 - :func:`money.category.count_candidates` counts candidate categories by item.
+- :func:`money.category.categorize_matches` applies categories using a lookup
+  from :func:`money.category.lookup_categories`.
 
 These high-level functions take a series of transaction descriptions, and they
 use these transaction descriptions and their indices to assign categories.
@@ -69,6 +71,18 @@ algorithm to each value in the series.
 The high-level functions use :func:`money.category.apply_to_series_using_index`
 to apply the ``row_*`` functions in a way that exposes the series index.
 
+When categorizing the same descriptions with several category dicts, it's
+cheaper to match each unique description against the union of all patterns
+once, resolve a description lookup for each dict, and then map the series
+through each lookup. ::
+
+    matches = category.match_patterns(series, [r"COFFEE \\d+"])
+    lookup = category.lookup_categories(categories, matches)
+    category.categorize_matches(series, lookup, edits=edits)
+    # 10      None
+    # 11    coffee
+    # 12      misc
+
 """
 import pandas as pd
 import re
@@ -112,6 +126,81 @@ def count_candidates(series, categories, edits=None):
                                        series, categories, edits=edits)
 
 
+def categorize_matches(series, lookup, edits=None):
+    """Assign categories using a precomputed description lookup.
+
+    This function gives the same result as :func:`money.category.categorize`
+    when ``lookup`` comes from :func:`money.category.lookup_categories`. It maps
+    each description through ``lookup`` rather than running the regular
+    expressions again. ``lookup`` must have a key for every description in the
+    ``series``.
+
+    Arguments:
+        series: Pandas Series of transaction descriptions.
+        lookup (dict): Category for each description.
+        edits (dict): Index-specific manual categorizations.
+
+    Returns:
+        A Pandas Series with categories.
+
+    """
+    result = pd.Series([lookup[d] for d in series],
+                       index=series.index, dtype=object)
+    # Apply index-specific manual categorizations where no pattern matched.
+    if edits:
+        for index, category in edits.items():
+            if category and index in result.index and result[index] is None:
+                result[index] = category
+    return result
+
+
+def lookup_categories(categories, matches):
+    """Resolve a category for each description from precomputed matches.
+
+    Like :func:`money.category.row_categorize`, the function picks the first
+    category, in ``categories`` order, with a pattern that matches the
+    description. Descriptions with no matching pattern get None.
+
+    Arguments:
+        categories (dict): Regex patterns for each category.
+        matches (dict): Sets of matching patterns, keyed by description.
+
+    Returns:
+        dict: Category for each description.
+
+    """
+    # Rank each pattern by the first category that uses it.
+    ranks = dict()
+    for rank, patterns in enumerate(categories.values()):
+        for p in patterns:
+            ranks.setdefault(p, rank)
+    names = list(categories)
+    lookup = dict()
+    for description, matched in matches.items():
+        found = [ranks[p] for p in matched if p in ranks]
+        lookup[description] = names[min(found)] if found else None
+    return lookup
+
+
+def match_patterns(series, patterns):
+    """Find the patterns that match each unique transaction description.
+
+    Each regular expression runs once per unique description, no matter how
+    many times the description appears in the ``series``.
+
+    Arguments:
+        series: Iterable of transaction descriptions.
+        patterns: Iterable of regex patterns.
+
+    Returns:
+        dict: Sets of matching patterns, keyed by description.
+
+    """
+    compiled = [(p, re.compile(p)) for p in dict.fromkeys(patterns)]
+    return {d: {p for p, r in compiled if r.fullmatch(d)}
+            for d in pd.unique(pd.Series(series, dtype=object))}
+
+
 def row_categorize(row, categories, edits=None):
     """Categorize one indexed transaction "row".
 
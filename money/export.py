@@ -0,0 +1,327 @@
+"""Utilities for exporting tables.
+
+This module writes processed transaction data and summary tables to CSV or
+Parquet files. It works on chunks of rows, so exports do not build whole copies
+of large tables in memory.
+
+The main high level functions are :func:`money.export.export` and
+:func:`money.export.export_reports`. The first writes the transactions from
+:func:`money.process.process` to a single file. The second writes the
+transactions and summary tables to a directory. ::
+
+    import process
+    import export
+
+    df = process.process(bundles, "budget.yaml")
+
+    # Export some columns for one year.
+    export.export(df, "2019.csv", columns=["date", "amount"],
+                  start="2019-01-01", end="2019-12-31")
+
+    # Export transactions and summaries.
+    export.export_reports(df, "reports", fmt="parquet")
+
+The file format comes from the file extension, either ".csv" or ".parquet".
+Parquet export requires `pyarrow`__.
+
+__ https://arrow.apache.org/docs/python/
+
+The export pipeline is a series of generators. :func:`money.export.iter_chunks`
+slices a dataframe into chunks of rows, :func:`money.export.select` filters each
+chunk by date and column, and a writer such as :func:`money.export.write_csv`
+consumes the chunks and writes them to disk.
+
+The summary functions also consume chunks, combining partial totals as they go.
+
+- :func:`money.export.summarize_categories`: Totals by category.
+- :func:`money.export.summarize_sources`: Totals by data source.
+- :func:`money.export.summarize_periods`: Totals by time period.
+
+"""
+import os.path
+import pandas as pd
+
+
+CHUNKSIZE = 10000
+BUFFER_SIZE = 1024 * 1024
+
+
+def export(df, path, columns=None, start=None, end=None, chunksize=CHUNKSIZE):
+    """Export transaction data to a CSV or Parquet file.
+
+    Arguments:
+        df: Pandas dataframe with processed transaction data.
+        path (str): Path to the output file, ending in ".csv" or ".parquet".
+        columns (list): Columns to export. Defaults to all columns.
+        start: Earliest transaction date to export.
+        end: Latest transaction date to export.
+        chunksize (int): Number of rows to write at a time.
+
+    Returns:
+        int: Number of rows written.
+
+    Raises:
+        ValueError: If the file extension is not a supported format.
+
+    """
+    writer = get_writer(os.path.splitext(path)[1])
+    chunks = select(iter_chunks(df, chunksize),
+                    columns=columns, start=start, end=end)
+    return writer(chunks, path)
+
+
+def export_reports(df, directory, fmt="csv", start=None, end=None, freq="M",
+                   chunksize=CHUNKSIZE):
+    """Export transaction data and summary tables to a directory.
+
+    The function writes four files to the ``directory``: "transactions",
+    "categories", "sources", and "periods", each with the extension for
+    ``fmt``. The summaries only include transactions in the date range.
+
+    Arguments:
+        df: Pandas dataframe with processed transaction data.
+        directory (str): Path to an existing output directory.
+        fmt (str): Output format, either "csv" or "parquet".
+        start: Earliest transaction date to export.
+        end: Latest transaction date to export.
+        freq (str): Pandas period frequency for the period summary.
+        chunksize (int): Number of rows to process at a time.
+
+    Returns:
+        dict: Paths to the exported files, keyed by table name.
+
+    Raises:
+        ValueError: If ``fmt`` is not a supported format.
+
+    """
+    fmt = fmt.lower()
+    get_writer("." + fmt)
+
+    def chunks():
+        return select(iter_chunks(df, chunksize), start=start, end=end)
+
+    tables = {
+        "categories": summarize_categories(chunks()),
+        "sources": summarize_sources(chunks()),
+        "periods": summarize_periods(chunks(), freq=freq)
+    }
+    paths = dict()
+    paths["transactions"] = os.path.join(directory, "transactions." + fmt)
+    export(df, paths["transactions"], start=start, end=end,
+           chunksize=chunksize)
+    for name, table in tables.items():
+        paths[name] = os.path.join(directory, name + "." + fmt)
+        export(table, paths[name], chunksize=chunksize)
+    return paths
+
+
+def iter_chunks(df, chunksize=CHUNKSIZE):
+    """Generate chunks of rows from a dataframe.
+
+    An empty dataframe yields one empty chunk, so that writers still get the
+    columns.
+
+    Arguments:
+        df: Pandas dataframe to split into chunks.
+        chunksize (int): Number of rows in each chunk.
+
+    Yields:
+        Pandas dataframes with at most ``chunksize`` rows.
+
+    """
+    if len(df) == 0:
+        yield df
+    for i in range(0, len(df), chunksize):
+        yield df.iloc[i:i + chunksize]
+
+
+def select(chunks, columns=None, start=None, end=None):
+    """Filter chunks of transaction data by date and column.
+
+    The date range includes both ``start`` and ``end``. Either may be omitted.
+    The function filters by date before selecting columns, so ``columns`` does
+    not need to include "date".
+
+    Arguments:
+        chunks: Iterable of Pandas dataframes with transaction data.
+        columns (list): Columns to keep. Defaults to all columns.
+        start: Earliest transaction date to keep.
+        end: Latest transaction date to keep.
+
+    Yields:
+        Filtered Pandas dataframes.
+
+    """
+    for chunk in chunks:
+        if start is not None:
+            chunk = chunk[chunk["date"] >= pd.Timestamp(start)]
+        if end is not None:
+            chunk = chunk[chunk["date"] <= pd.Timestamp(end)]
+        if columns is not None:
+            chunk = chunk.loc[:, columns]
+        yield chunk
+
+
+def write_csv(chunks, path, buffer_size=BUFFER_SIZE):
+    """Write chunks of a table to a CSV file.
+
+    The header comes from the first chunk. If there are no chunks, the function
+    writes an empty file.
+
+    Arguments:
+        chunks: Iterable of Pandas dataframes with the same columns.
+        path (str): Path to the output file.
+        buffer_size (int): Size of the file buffer in bytes.
+
+    Returns:
+        int: Number of rows written.
+
+    """
+    rows = 0
+    header = True
+    with open(path, "w", newline="", buffering=buffer_size) as f:
+        for chunk in chunks:
+            chunk.to_csv(f, header=header)
+            header = False
+            rows += len(chunk)
+    return rows
+
+
+def write_parquet(chunks, path):
+    """Write chunks of a table to a Parquet file.
+
+    Each chunk becomes a row group. The schema comes from the first chunk, with
+    any all-null columns stored as strings. The index is stored as columns, so
+    each chunk keeps its own labels, as in :func:`money.export.write_csv`. If
+    there are no chunks, the function writes no file.
+
+    Arguments:
+        chunks: Iterable of Pandas dataframes with the same columns.
+        path (str): Path to the output file.
+
+    Returns:
+        int: Number of rows written.
+
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=True)
+                fields = [f.with_type(pa.string()) if pa.types.is_null(f.type)
+                          else f for f in schema]
+                schema = pa.schema(fields, metadata=schema.metadata)
+                writer = pq.ParquetWriter(path, schema)
+            table = pa.Table.from_pandas(chunk, schema=schema,
+                                          preserve_index=True)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def summarize_categories(chunks):
+    """Total transaction amounts by category.
+
+    Arguments:
+        chunks: Iterable of Pandas dataframes with transaction data.
+
+    Returns:
+        A Pandas dataframe with columns ``amount`` and ``count``.
+
+    """
+    return summarize(chunks, lambda x: x["category"])
+
+
+def summarize_sources(chunks):
+    """Total transaction amounts by data source.
+
+    Arguments:
+        chunks: Iterable of Pandas dataframes with transaction data.
+
+    Returns:
+        A Pandas dataframe with columns ``amount`` and ``count``.
+
+    """
+    return summarize(chunks, lambda x: x.index.get_level_values("source"))
+
+
+def summarize_periods(chunks, freq="M"):
+    """Total transaction amounts by time period.
+
+    Arguments:
+        chunks: Iterable of Pandas dataframes with transaction data.
+        freq (str): Pandas period frequency, such as "M" for months.
+
+    Returns:
+        A Pandas dataframe with columns ``amount`` and ``count``.
+
+    """
+    return summarize(chunks,
+                     lambda x: x["date"].dt.to_period(freq).rename("period"))
+
+
+def summarize(chunks, key):
+    """Total transaction amounts and counts by group across chunks.
+
+    The function combines the totals for each chunk as it goes, so it only keeps
+    one chunk and one running total in memory. Transactions with a missing key
+    form their own group. The ``count`` column counts transactions, including
+    any with a missing amount.
+
+    Arguments:
+        chunks: Iterable of Pandas dataframes with transaction data.
+        key (function): Takes a chunk and returns the group for each row.
+
+    Returns:
+        A Pandas dataframe with columns ``amount`` and ``count``, indexed by
+        group and sorted.
+
+    """
+    total = None
+    for chunk in chunks:
+        partial = (chunk.groupby(key(chunk), dropna=False)["amount"]
+                        .agg(["sum", "size"]))
+        if total is not None:
+            partial = (pd.concat([total, partial])
+                         .groupby(level=0, dropna=False)
+                         .sum())
+        total = partial
+    if total is None:
+        total = pd.DataFrame({"sum": [], "size": []})
+    return (total.rename(columns={"sum": "amount", "size": "count"})
+                 .astype({"count": int})
+                 .sort_index())
+
+
+def get_writer(extension):
+    """Find the writer for a file extension.
+
+    Arguments:
+        extension (str): File extension, such as ".csv".
+
+    Returns:
+        function: Writer that takes chunks and a path.
+
+    Raises:
+        ValueError: If the extension is not a supported format.
+
+    """
+    try:
+        return WRITERS[extension.lower()]
+    except KeyError:
+        supported = ", ".join(WRITERS)
+        raise ValueError(f"Unsupported export format {extension!r}. "
+                         f"Use one of: {supported}.") from None
+
+
+WRITERS = {
+    ".csv": write_csv,
+    ".parquet": write_parquet
+}
@@ -37,6 +37,11 @@ wrappers could grow with the addition of any new data sources.
 Function :func:`money.process.assemble` concatenates the standard datasets and
 assigns an index to identify each transaction by its source and source index.
 
+Function :func:`money.process.process_budgets` compares several budgets against
+the same bundles. It reads and prepares the data once, and it returns a
+processed dataset for each budget along with a table of transactions that the
+budgets categorize differently.
+
 """
 import os.path
 import pandas as pd
@@ -65,16 +70,89 @@ def process(bundles, budget_path):
     Returns:
         A Pandas dataframe with processed transaction data.
 
+    """
+    read_bundles(bundles)
+    categories = read_categories(budget_path)
+    return assemble(bundles, categories)
+
+
+def process_budgets(bundles, budget_paths):
+    """Process raw transaction data saved on disk using several budgets.
+
+    This function is like :func:`money.process.process`, but it compares the
+    categorizations from several budgets. It reads and prepares the source data
+    once, and it matches each unique transaction description against the union
+    of all budget patterns once. Each budget then resolves a category for each
+    unique description, and categorizing each transaction is a lookup.
+
+    The disagreement table has the description and one category column for each
+    budget path. It only includes transactions that the budgets categorize
+    differently.
+
+    Arguments:
+        bundles (list): Dicts with paths to source data.
+        budget_paths (list): Paths to budget files.
+
+    Returns:
+        A tuple with a dict of processed dataframes, keyed by budget path, and a
+        Pandas dataframe of disagreements between budgets.
+
+    Raises:
+        ValueError: If ``budget_paths`` is empty.
+
+    """
+    if not budget_paths:
+        raise ValueError("process_budgets needs at least one budget path.")
+    read_bundles(bundles)
+    budgets = {path: read_categories(path) for path in budget_paths}
+    frames = [b["df"].pipe(PREP_FUNCTIONS[b["type"]], None) for b in bundles]
+    keys = [b["source"] for b in bundles]
+    descriptions = pd.concat([f["desc"] for f in frames])
+    patterns = [p for c in budgets.values() for ps in c.values() for p in ps]
+    matches = cg.match_patterns(descriptions, patterns)
+
+    results = dict()
+    for path, categories in budgets.items():
+        lookup = cg.lookup_categories(categories, matches)
+        categorized = [f.assign(category=cg.categorize_matches(f["desc"],
+                                                               lookup,
+                                                               edits=b["edits"]))
+                       for f, b in zip(frames, bundles)]
+        results[path] = pd.concat(categorized, keys=keys,
+                                  names=["source", "item"])
+    return results, get_disagreements(results)
+
+
+def read_bundles(bundles):
+    """Read the source data and edits for each bundle.
+
+    The function adds the dataframe, the data source, and the edits to each of
+    the ``bundles`` in place.
+
+    Arguments:
+        bundles (list): Dicts with paths to source data.
+
     """
     for b in bundles:
         b["df"] = pd.read_csv(b["path"], index_col=False)
         b["source"] = os.path.basename(b["path"])
         with open(b["edits_path"]) as f:
             b["edits"] = yaml.safe_load(f)
+
+
+def read_categories(budget_path):
+    """Read a budget file and extract its category dict.
+
+    Arguments:
+        budget_path (str): Path to a budget file.
+
+    Returns:
+        A dict of categories.
+
+    """
     with open(budget_path) as f:
         budget = yaml.safe_load(f)
-    categories = get_categories(budget)
-    return assemble(bundles, categories)
+    return get_categories(budget)
 
 
 def assemble(bundles, categories):
@@ -99,14 +177,9 @@ def assemble(bundles, categories):
         categories (dict): Regex patterns for each category.
 
     """
-    prep_functions = {
-        "credit": prep_credit,
-        "checking": prep_checking
-    }
-
     frames = []
     for b in bundles:
-        prep_function = prep_functions[b["type"]]
+        prep_function = PREP_FUNCTIONS[b["type"]]
         prepped = (b["df"].pipe(prep_function, categories, edits=b["edits"]))
         frames.append(prepped)
 
@@ -168,7 +241,8 @@ def prep_transactions(df, cols, categories, edits=None):
     - Rename columns with shorter, standardized names.
     - Reverse the index to start with the earliest transaction.
     - Update variable ``date`` to have the datetime dtype.
-    - Add variable ``category`` to categorize the transaction.
+    - Add variable ``category`` to categorize the transaction, unless
+      ``categories`` is None.
 
     Argument ``cols`` is a dict with the following keys:
 
@@ -198,13 +272,15 @@ def prep_transactions(df, cols, categories, edits=None):
     colnames = ["date", "desc", "amount"]
     keeps = [cols[c] for c in colnames]
     renames = {cols[c]: c for c in colnames}
-    return (df.loc[:, keeps]
-              .rename(columns=renames)
-              .set_index(df.index[::-1])  # Reverse index.
-              .assign(date=lambda x: pd.to_datetime(x["date"]))
-              .assign(category=lambda x: cg.categorize(x["desc"],
-                                                       categories,
-                                                       edits=edits)))
+    prepped = (df.loc[:, keeps]
+                 .rename(columns=renames)
+                 .set_index(df.index[::-1])  # Reverse index.
+                 .assign(date=lambda x: pd.to_datetime(x["date"])))
+    if categories is None:
+        return prepped
+    return prepped.assign(category=lambda x: cg.categorize(x["desc"],
+                                                           categories,
+                                                           edits=edits))
 
 
 def get_categories(budget):
@@ -222,3 +298,34 @@ def get_categories(budget):
         if item["patterns"]:
             categories[item["name"]] = item["patterns"]
     return categories
+
+
+def get_disagreements(results):
+    """Compare categories across processed datasets.
+
+    Arguments:
+        results (dict): Processed dataframes, keyed by budget.
+
+    Returns:
+        A Pandas dataframe with the description and the category from each
+        budget, for transactions where the categories differ.
+
+    Raises:
+        ValueError: If ``results`` is empty.
+
+    """
+    if not results:
+        raise ValueError("get_disagreements needs at least one result.")
+    first = next(iter(results.values()))
+    table = pd.DataFrame({"desc": first["desc"]})
+    for key, df in results.items():
+        table[key] = df["category"]
+    compared = table.drop(columns="desc").fillna("")
+    differs = compared.nunique(axis=1) > 1
+    return table[differs]
+
+
+PREP_FUNCTIONS = {
+    "credit": prep_credit,
+    "checking": prep_checking
+}
@@ -72,3 +72,48 @@ def test_is_match():
     patterns1 = ["blah", r"COFFEE \d+"]
     assert category.is_match(string, patterns0) == False
     assert category.is_match(string, patterns1) == True
+
+
+def test_categorize_matches():
+    """Tests category.categorize_matches.
+
+    Tests that:
+    - Result matches category.categorize.
+    - Result preserves the input series index.
+
+    """
+    series = pd.Series(["blah", "COFFEE 001", "stuff"], index=[10, 11, 12])
+    categories = {"coffee": [r"COFFEE \d+"]}
+    edits = {11: "misc", 12: "misc"}
+    matches = category.match_patterns(series, [r"COFFEE \d+", "blah"])
+    lookup = category.lookup_categories(categories, matches)
+    result = category.categorize_matches(series, lookup, edits=edits)
+    expected = category.categorize(series, categories, edits=edits)
+    assert result.to_list() == expected.to_list()
+    assert result.index.to_list() == [10, 11, 12]
+
+
+def test_lookup_categories():
+    """Tests category.lookup_categories.
+
+    Tests that:
+    - Result has the first matching category in ``categories`` order.
+    - Patterns outside ``categories`` are ignored.
+    - Descriptions with no matching pattern get None.
+
+    """
+    categories = {"coffee": [r"COFFEE \d+"], "misc": [r"\w+", "blah"]}
+    matches = {
+        "COFFEE 001": {r"COFFEE \d+", r"\w+ \d+"},
+        "blah": {"blah", r"\w+"},
+        "stuff": {"other"}
+    }
+    result = category.lookup_categories(categories, matches)
+    assert result == {"COFFEE 001": "coffee", "blah": "misc", "stuff": None}
+
+
+def test_match_patterns():
+    series = pd.Series(["blah", "COFFEE 001", "blah"])
+    patterns = ["blah", r"COFFEE \d+", r"\w+"]
+    result = category.match_patterns(series, patterns)
+    assert result == {"blah": {"blah", r"\w+"}, "COFFEE 001": {r"COFFEE \d+"}}
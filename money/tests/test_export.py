@@ -0,0 +1,196 @@
+import pytest
+import pandas as pd
+import pandas.testing as pdt
+from .. import export as ex
+
+
+@pytest.fixture
+def transactions():
+    """Processed transaction dataframe."""
+    data = {
+        "date": pd.to_datetime(["01/01/2019", "01/15/2019", "02/01/2019",
+                                "01/02/2019", "03/01/2019"]),
+        "desc": ("item0", "item1", "item0", "item2", "item1"),
+        "amount": (-10, -20, -10, -5, -20),
+        "category": ("cat0", "cat1", "cat0", None, "cat1")
+    }
+    df = pd.DataFrame(data)
+    df.index = pd.MultiIndex.from_tuples(
+        [("credit0", 0), ("credit0", 1), ("credit0", 2),
+         ("checking0", 0), ("checking0", 1)],
+        names=["source", "item"]
+    )
+    return df
+
+
+def test_iter_chunks(transactions):
+    chunks = list(ex.iter_chunks(transactions, 2))
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    pdt.assert_frame_equal(pd.concat(chunks), transactions)
+    empty = list(ex.iter_chunks(transactions.iloc[:0], 2))
+    assert [len(c) for c in empty] == [0]
+
+
+def test_select(transactions):
+    """Tests export.select.
+
+    Tests that:
+    - Date range includes both ends.
+    - Columns are selected after filtering by date.
+
+    """
+    chunks = ex.iter_chunks(transactions, 2)
+    result = pd.concat(ex.select(chunks, columns=["amount"],
+                                 start="2019-01-02", end="2019-02-01"))
+    assert result.columns.to_list() == ["amount"]
+    assert result.index.to_list() == [("credit0", 1), ("credit0", 2),
+                                      ("checking0", 0)]
+
+
+def test_write_csv(tmp_path, transactions):
+    path = tmp_path / "transactions.csv"
+    rows = ex.write_csv(ex.iter_chunks(transactions, 2), path)
+    result = pd.read_csv(path, index_col=["source", "item"],
+                         parse_dates=["date"])
+    assert rows == 5
+    pdt.assert_frame_equal(result, transactions)
+
+
+def test_write_parquet(tmp_path, transactions):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "transactions.parquet"
+    rows = ex.write_parquet(ex.iter_chunks(transactions, 3), path)
+    result = pd.read_parquet(path)
+    assert rows == 5
+    pdt.assert_frame_equal(result, transactions)
+
+
+@pytest.mark.parametrize("index", [pd.RangeIndex(2, 7),
+                                   pd.RangeIndex(4, -1, -1)])
+def test_write_parquet_range_index(tmp_path, transactions, index):
+    """Tests export.write_parquet with a range index across chunks.
+
+    Tests that each chunk keeps its index labels, like prepped data with a
+    reversed index.
+
+    """
+    pytest.importorskip("pyarrow")
+    df = transactions.set_index(index)
+    path = tmp_path / "transactions.parquet"
+    ex.write_parquet(ex.iter_chunks(df, 2), path)
+    result = pd.read_parquet(path)
+    assert result.index.to_list() == index.to_list()
+    pdt.assert_frame_equal(result, df, check_index_type=False)
+
+
+def test_summarize_categories(transactions):
+    result = ex.summarize_categories(ex.iter_chunks(transactions, 2))
+    assert result.columns.to_list() == ["amount", "count"]
+    assert result.index.to_list()[:2] == ["cat0", "cat1"]
+    assert result["amount"].to_list() == [-20, -40, -5]
+    assert result["count"].to_list() == [2, 2, 1]
+
+
+def test_summarize_categories_missing_amount(transactions):
+    transactions["amount"] = transactions["amount"].astype(float)
+    transactions.iloc[0, transactions.columns.get_loc("amount")] = None
+    result = ex.summarize_categories(ex.iter_chunks(transactions, 2))
+    assert result.loc["cat0", "amount"] == -10
+    assert result.loc["cat0", "count"] == 2
+
+
+def test_summarize_sources(transactions):
+    result = ex.summarize_sources(ex.iter_chunks(transactions, 2))
+    assert result.index.to_list() == ["checking0", "credit0"]
+    assert result["amount"].to_list() == [-25, -40]
+    assert result["count"].to_list() == [2, 3]
+
+
+def test_summarize_periods(transactions):
+    result = ex.summarize_periods(ex.iter_chunks(transactions, 2))
+    assert result.index.astype(str).to_list() == ["2019-01", "2019-02",
+                                                  "2019-03"]
+    assert result["amount"].to_list() == [-35, -10, -20]
+
+
+def read_table(path, index_col):
+    """Read an exported CSV or Parquet table."""
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, index_col=index_col)
+
+
+@pytest.fixture(params=["csv", "parquet"])
+def fmt(request):
+    """Export format to test."""
+    if request.param == "parquet":
+        pytest.importorskip("pyarrow")
+    return request.param
+
+
+def test_export_reports(tmp_path, transactions, fmt):
+    """Tests export.export_reports.
+
+    Tests that:
+    - Function writes the transactions and each summary table.
+    - Transactions and summaries only include the date range.
+
+    """
+    paths = ex.export_reports(transactions, str(tmp_path), fmt=fmt,
+                              end="2019-02-01", chunksize=2)
+    assert sorted(paths) == ["categories", "periods", "sources",
+                             "transactions"]
+    trans = read_table(paths["transactions"], ["source", "item"])
+    assert trans.index.to_list() == [("credit0", 0), ("credit0", 1),
+                                     ("credit0", 2), ("checking0", 0)]
+    categories = read_table(paths["categories"], "category")
+    assert categories["amount"].to_list() == [-20, -20, -5]
+    assert categories["count"].to_list() == [2, 1, 1]
+    sources = read_table(paths["sources"], "source")
+    assert sources.index.to_list() == ["checking0", "credit0"]
+    assert sources["count"].to_list() == [1, 3]
+    periods = read_table(paths["periods"], "period")
+    assert periods.index.astype(str).to_list() == ["2019-01", "2019-02"]
+    assert periods["amount"].to_list() == [-35, -10]
+
+
+def test_export_reports_empty_range(tmp_path, transactions, fmt):
+    """Tests export.export_reports with a date range that matches nothing.
+
+    Tests that each table exists with its columns and no rows.
+
+    """
+    paths = ex.export_reports(transactions, str(tmp_path), fmt=fmt,
+                              start="2030-01-01")
+    trans = read_table(paths["transactions"], ["source", "item"])
+    assert len(trans) == 0
+    assert trans.columns.to_list() == transactions.columns.to_list()
+    for name, index_col in [("categories", "category"),
+                            ("sources", "source"),
+                            ("periods", "period")]:
+        table = read_table(paths[name], index_col)
+        assert len(table) == 0
+        assert table.columns.to_list() == ["amount", "count"]
+
+
+def test_export_empty(tmp_path, transactions, fmt):
+    path = str(tmp_path / ("transactions." + fmt))
+    rows = ex.export(transactions.iloc[:0], path)
+    result = read_table(path, ["source", "item"])
+    assert rows == 0
+    assert result.columns.to_list() == transactions.columns.to_list()
+
+
+def test_export_format(tmp_path, transactions):
+    """Tests export format handling.
+
+    Tests that:
+    - Extensions are case insensitive.
+    - Unsupported formats raise a ValueError.
+
+    """
+    assert ex.export(transactions, str(tmp_path / "transactions.CSV")) == 5
+    with pytest.raises(ValueError, match=".csv, .parquet"):
+        ex.export(transactions, str(tmp_path / "transactions.txt"))
+    with pytest.raises(ValueError):
+        ex.export_reports(transactions, str(tmp_path), fmt="xlsx")
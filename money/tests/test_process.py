@@ -85,6 +85,46 @@ def test_prep_checking(checking_bundle, categories, expected_prep_result):
     pdt.assert_frame_equal(result, expected_prep_result)
 
 
+def test_process_budgets(tmp_path, credit_bundle):
+    """Tests process.process_budgets.
+
+    Tests that:
+    - Each budget gets the same result as process.process.
+    - Disagreements include only transactions categorized differently.
+
+    """
+    credit_bundle["df"].to_csv(tmp_path / "credit0.csv", index=False)
+    (tmp_path / "credit0.yaml").write_text("1: cat1\n")
+    (tmp_path / "budget0.yaml").write_text(
+        "- {name: cat0, patterns: [item0]}\n"
+    )
+    (tmp_path / "budget1.yaml").write_text(
+        "- {name: cat0, patterns: [item0]}\n"
+        "- {name: cat2, patterns: ['item\\d']}\n"
+    )
+    budget_paths = [str(tmp_path / "budget0.yaml"),
+                    str(tmp_path / "budget1.yaml")]
+
+    def make_bundles():
+        return [{"type": "credit",
+                 "path": str(tmp_path / "credit0.csv"),
+                 "edits_path": str(tmp_path / "credit0.yaml")}]
+
+    results, disagreements = prc.process_budgets(make_bundles(), budget_paths)
+    for path in budget_paths:
+        expected = prc.process(make_bundles(), path)
+        pdt.assert_frame_equal(results[path], expected)
+    assert disagreements.index.to_list() == [("credit0.csv", 1)]
+    assert disagreements.loc[("credit0.csv", 1)].to_list() == ["item1",
+                                                               "cat1",
+                                                               "cat2"]
+
+
+def test_process_budgets_without_budgets():
+    with pytest.raises(ValueError):
+        prc.process_budgets([], [])
+
+
 def test_get_categories():
     budget = [
         {"name": "cat0", "patterns": None},